@@ -1,23 +1,55 @@
 # ─────────────────────────────────────────────────────────────
 #  CarePath AI Foundation – Parkinson's Voice Classifier API
-#  Supports: WebM/Opus or WAV uploads →
+#  Supports: WebM/Opus or WAV uploads (multipart "file" or raw audio/* body) →
 #            extracts 16 voice features → Random-Forest at
 #            threshold 0.63 → JSON result
+#  POST /predict queues a Celery job (202 + job_id);
+#  GET  /predict/<job_id> returns the result once ready.
+#  Worker:  PYTHONPATH=. celery -A app:celery worker --pool threads
 # ─────────────────────────────────────────────────────────────
 
-import os, uuid, tempfile, warnings
-from flask import Flask, request, jsonify
+import os, base64, queue, struct, subprocess, tempfile, time, warnings, threading
+
+# Single-threaded math libraries: each request is tiny, and parallelism comes
+# from worker processes + the process pool.  Must be set before numpy loads.
+for _var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
+import multiprocessing as mp
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from flask import Flask, Request, request, jsonify
+from werkzeug.exceptions import ClientDisconnected
 from flask_cors import CORS
-from pydub import AudioSegment
-import joblib
+from celery import Celery
+from celery.exceptions import WorkerShutdown
+from celery.signals import worker_init
+import blake3
+import ffmpeg
+import redis
 import numpy as np
-import pandas as pd
+import onnxruntime as ort
 import parselmouth
+from parselmouth.praat import call
 
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
-MODEL_PATH  = "rf_model.pkl"
+MODEL_PATH  = "rf_model.onnx"   # exported from rf_model.pkl by convert_model.py
 THRESHOLD   = 0.63
+SAMPLE_RATE = 8000              # Hz; F0 <= 500 Hz, so 8 kHz keeps every feature
+N_WORKERS   = int(os.environ.get("N_WORKERS", os.cpu_count() or 1))
+MAX_BATCH   = 32
+BATCH_WAIT  = 0.005             # seconds to wait for more rows once one arrives
+SCORE_TIMEOUT = 30              # s a job waits for its row to be scored
+CACHE_TTL   = 24 * 3600         # s a probability is remembered, keyed by upload hash
+DECODE_TIMEOUT = 60             # s allowed for a streamed upload + ffmpeg decode
+WAV_MIMETYPES  = ("audio/wav", "audio/x-wav", "audio/wave")
+UPLOAD_SPOOL   = 8 << 20        # multipart uploads stay in RAM up to this size
+PITCH_FLOOR, PITCH_CEILING = 75, 500   # Hz, sustained-vowel F0 range
+PITCH_STEP  = 0.02              # s between pitch frames
+BROKER_URL  = os.environ.get("CELERY_BROKER_URL", "redis://localhost:6379/0")
+RESULT_URL  = os.environ.get("CELERY_RESULT_BACKEND", BROKER_URL)
+CACHE_URL   = os.environ.get("RESULT_CACHE_URL", BROKER_URL)
 
 FEATURE_COLS = [
     'MDVP:Fo(Hz)', 'MDVP:Fhi(Hz)', 'MDVP:Flo(Hz)',
@@ -26,95 +58,419 @@ FEATURE_COLS = [
     'Shimmer:APQ5', 'MDVP:APQ', 'Shimmer:DDA', 'NHR', 'HNR'
 ]
 
+class InMemoryRequest(Request):
+    # Werkzeug spools multipart files over 500 KB to a temp file; a voice
+    # clip is a few MB at most, so keep it in memory instead
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL, mode="rb+")
+
 app = Flask(__name__)
+app.request_class = InMemoryRequest
 CORS(app, resources={r"/predict": {"origins": "*"}})
-rf_model = joblib.load(MODEL_PATH)
 
-def _cleanup(paths):
-    for p in paths:
+# Feature extraction and inference run in Celery workers, which scale
+# separately.  The web tier queues jobs and decodes raw audio/* bodies with
+# ffmpeg as they stream in (stream_to_pcm, in the request thread), so the
+# job carries PCM.  Workers use the threads pool:
+# prefork children are daemonic and could not start the process pool below.
+celery = Celery(__name__, broker=BROKER_URL, backend=RESULT_URL)
+celery.conf.update(result_expires=3600, worker_prefetch_multiplier=1)
+
+# The model lives only where score() runs: the Celery worker process.  It is
+# built on first use (or at worker start, see _warmup_worker); the web tier
+# and the spawned pool children never load it.
+_session = None
+_session_lock = threading.Lock()
+
+def get_session() -> ort.InferenceSession:
+    global _session
+    with _session_lock:
+        if _session is None:
+            opts = ort.SessionOptions()
+            opts.intra_op_num_threads = 1
+            opts.inter_op_num_threads = 1
+            _session = ort.InferenceSession(MODEL_PATH, sess_options=opts,
+                                            providers=["CPUExecutionProvider"])
+        return _session
+
+# Decode + feature extraction run in a process pool so the CPU work spreads
+# over cores.  Created lazily so every Celery worker gets its own pool;
+# "spawn" children import this module, warm up Praat, and never load the model.
+_pool = None
+_pool_lock = threading.Lock()
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=N_WORKERS,
+                                        mp_context=mp.get_context("spawn"),
+                                        initializer=_warmup_features)
+        return _pool
+
+# Rows from concurrent jobs are scored together: a background thread
+# drains the queue into one (n, 16) batch per ONNX call.
+_batch_q = queue.Queue()
+_batcher = None
+_batcher_lock = threading.Lock()
+
+def _batch_loop():
+    global _batcher
+    try:
+        session = get_session()
+    except Exception as e:
+        # No model: fail every waiting row, and let the next score() start
+        # a fresh batcher that tries to load it again
+        with _batcher_lock:
+            _batcher = None
+            while True:
+                try:
+                    _, fut = _batch_q.get_nowait()
+                except queue.Empty:
+                    break
+                if fut.set_running_or_notify_cancel():
+                    fut.set_exception(e)
+        return
+    while True:
+        items = [_batch_q.get()]
+        deadline = time.monotonic() + BATCH_WAIT
+        while len(items) < MAX_BATCH:
+            try:
+                items.append(_batch_q.get(timeout=max(deadline - time.monotonic(), 0)))
+            except queue.Empty:
+                break
+        # Drop rows whose caller already gave up (see score)
+        items = [(row, fut) for row, fut in items if fut.set_running_or_notify_cancel()]
+        if not items:
+            continue
+        try:
+            X = np.vstack([row for row, _ in items])
+            probs = session.run(None, {"x": X})[1][:, 1]
+        except Exception as e:
+            for _, fut in items:
+                fut.set_exception(e)
+            continue
+        for (_, fut), p in zip(items, probs):
+            fut.set_result(float(p))
+
+# Retried uploads of the same recording skip the queue entirely: the worker
+# stores upload hash → probability in Redis, where the web tier can see it
+_results = redis.Redis.from_url(CACHE_URL)
+
+def cached_probability(key: str) -> float | None:
+    try:
+        prob = _results.get(f"prob:{key}")
+    except redis.RedisError as e:
+        print("Result cache unavailable:", e)
+        return None
+    return None if prob is None else float(prob)
+
+def cache_probability(key: str, prob: float):
+    try:
+        _results.set(f"prob:{key}", prob, ex=CACHE_TTL)
+    except redis.RedisError as e:
+        print("Result cache unavailable:", e)
+
+def score(feats: np.ndarray) -> float:
+    global _batcher
+    fut = Future()
+    # Queue under the lock so a batcher that failed to start cannot miss the row
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = threading.Thread(target=_batch_loop, daemon=True)
+            _batcher.start()
+        _batch_q.put((feats, fut))
+    try:
+        return fut.result(timeout=SCORE_TIMEOUT)
+    except TimeoutError:
+        fut.cancel()
+        raise RuntimeError(f"Scoring timed out after {SCORE_TIMEOUT} s") from None
+
+def _pcm16_mono_wav_rate(data: bytes) -> int:
+    # RIFF/WAVE header with the "fmt " chunk first: PCM, mono, 16-bit.
+    # Returns its sample rate, or 0 when the upload needs ffmpeg.
+    head = data[:44]
+    if len(head) < 36 or head[:4] != b"RIFF" or head[8:12] != b"WAVE" or head[12:16] != b"fmt ":
+        return 0
+    fmt, channels, rate, _, _, bits = struct.unpack("<HHIIHH", head[20:36])
+    return rate if fmt == 1 and channels == 1 and bits == 16 else 0
+
+def _wav_samples(data: bytes) -> np.ndarray:
+    # Walk the RIFF chunks to the "data" payload (LIST/fact chunks may precede it)
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk, size = data[pos:pos + 4], struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        if chunk == b"data":
+            n = min(size, len(data) - pos - 8) // 2
+            return np.frombuffer(data, np.int16, count=n, offset=pos + 8)
+        pos += 8 + size + (size & 1)
+    raise ValueError("WAV upload has no data chunk")
+
+def _ffmpeg_to_pcm():
+    # stdin → mono 16-bit PCM at SAMPLE_RATE on stdout
+    return (ffmpeg.input("pipe:")
+            .output("pipe:", format="s16le", ac=1, ar=SAMPLE_RATE)
+            .global_args("-loglevel", "error"))
+
+def _decode_error(stderr: bytes) -> ValueError:
+    # Plain ValueError: ffmpeg.Error does not survive pickling back from the pool
+    msg = (stderr or b"").decode(errors="replace").strip().splitlines()
+    return ValueError(f"Could not decode audio: {msg[-1] if msg else 'ffmpeg failed'}")
+
+def stream_to_pcm(stream, head: bytes = b"", length: int | None = None,
+                  hasher=None) -> bytes:
+    # Feed the request body to ffmpeg as it arrives, so decoding overlaps
+    # the upload instead of waiting for the whole body to be buffered.
+    # hasher (e.g. blake3) sees the body exactly as received.
+    # stdout and stderr are drained on their own threads so neither pipe can
+    # fill up and stall ffmpeg.
+    proc = _ffmpeg_to_pcm().run_async(pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
+    out, err, feed_error = [], [], []
+
+    def feed():
+        try:
+            if hasher is not None:
+                hasher.update(head)
+            proc.stdin.write(head)
+            sent = len(head)
+            while chunk := stream.read(64 * 1024):
+                if hasher is not None:
+                    hasher.update(chunk)
+                proc.stdin.write(chunk)
+                sent += len(chunk)
+            # Some servers (gunicorn) end a dropped body quietly instead of raising
+            if length is not None and sent < length:
+                feed_error.append(EOFError(f"got {sent} of {length} bytes"))
+        except BrokenPipeError:
+            pass                # ffmpeg gave up early; its stderr says why
+        except Exception as e:
+            feed_error.append(e)    # client went away mid-upload
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    feeder  = threading.Thread(target=feed, daemon=True)
+    readers = [threading.Thread(target=lambda: out.append(proc.stdout.read()), daemon=True),
+               threading.Thread(target=lambda: err.append(proc.stderr.read()), daemon=True)]
+    for t in [feeder, *readers]:
+        t.start()
+    try:
+        proc.wait(timeout=DECODE_TIMEOUT)
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        timed_out = True
+    # Always wait for the feeder, even after a failure: gunicorn drains any
+    # unread body before reusing the connection, and must not race a thread
+    # still reading the same socket.  With ffmpeg gone its next write fails
+    # with BrokenPipeError, so it only runs on while the client is sending.
+    for t in [*readers, feeder]:
+        t.join()
+
+    if timed_out:
+        raise ValueError(f"Could not decode audio: no result within {DECODE_TIMEOUT} s")
+    # A truncated body can still decode cleanly; never score a fragment
+    if feed_error:
+        raise ClientDisconnected("Upload was interrupted before it finished")
+    if proc.returncode != 0:
+        raise _decode_error(err[0] if err else b"")
+    return out[0] if out else b""
+
+def decode_audio(data: bytes, kind: str = "encoded") -> parselmouth.Sound:
+    # kind: "pcm" (already decoded by stream_to_pcm), "wav" (mono 16-bit PCM
+    # WAV at any rate) or "encoded" (anything else ffmpeg can read)
+    if kind == "pcm":
+        pcm = np.frombuffer(data, np.int16)
+    elif kind == "wav":
+        # No ffmpeg round-trip; Praat resamples in-process if needed
+        rate = _pcm16_mono_wav_rate(data)
+        snd = parselmouth.Sound(values=_wav_samples(data).astype(np.float64) / 32768.0,
+                                sampling_frequency=rate)
+        return snd if rate == SAMPLE_RATE else snd.resample(SAMPLE_RATE)
+    else:
+        # Pipe the upload through ffmpeg, all in memory
         try:
-            if p and os.path.exists(p):
-                os.remove(p)
-        except Exception:
-            pass
+            out, _ = _ffmpeg_to_pcm().run(input=data, capture_stdout=True, capture_stderr=True)
+        except ffmpeg.Error as e:
+            raise _decode_error(e.stderr) from None
+        pcm = np.frombuffer(out, np.int16)
+    arr = pcm.astype(np.float64) / 32768.0
+    return parselmouth.Sound(values=arr, sampling_frequency=SAMPLE_RATE)
+
+# (feature, Praat command, args, scale, needs_sound): jitter queries run on
+# the PointProcess alone, shimmer queries on [Sound, PointProcess]
+_JITTER_ARGS  = (0, 0, 0.0001, 0.02, 1.3)
+_SHIMMER_ARGS = (0, 0, 0.0001, 0.02, 1.3, 1.6)
+_PRAAT_CALLS = (
+    ('MDVP:Jitter(%)',   "Get jitter (local)",           _JITTER_ARGS,  100.0, False),
+    ('MDVP:Jitter(Abs)', "Get jitter (local, absolute)", _JITTER_ARGS,  1.0,   False),
+    ('MDVP:RAP',         "Get jitter (rap)",             _JITTER_ARGS,  1.0,   False),
+    ('MDVP:PPQ',         "Get jitter (ppq5)",            _JITTER_ARGS,  1.0,   False),
+    ('Jitter:DDP',       "Get jitter (ddp)",             _JITTER_ARGS,  1.0,   False),
+    ('MDVP:Shimmer',     "Get shimmer (local)",          _SHIMMER_ARGS, 1.0,   True),
+    ('MDVP:Shimmer(dB)', "Get shimmer (local_dB)",       _SHIMMER_ARGS, 1.0,   True),
+    ('Shimmer:APQ3',     "Get shimmer (apq3)",           _SHIMMER_ARGS, 1.0,   True),
+    ('Shimmer:APQ5',     "Get shimmer (apq5)",           _SHIMMER_ARGS, 1.0,   True),
+    ('Shimmer:DDA',      "Get shimmer (dda)",            _SHIMMER_ARGS, 1.0,   True),
+)
 
-def extract_features(path_wav: str) -> pd.DataFrame:
-    snd = parselmouth.Sound(path_wav)
+def extract_features(snd: parselmouth.Sound) -> np.ndarray:
     feats = {}
 
-    pitch = snd.to_pitch()
-    feats['MDVP:Fo(Hz)']  = np.nanmean(pitch.selected_array['frequency'])
-    feats['MDVP:Fhi(Hz)'] = np.nanmax(pitch.selected_array['frequency'])
-    feats['MDVP:Flo(Hz)'] = np.nanmin(pitch.selected_array['frequency'])
+    pitch = snd.to_pitch_cc(time_step=PITCH_STEP, pitch_floor=PITCH_FLOOR,
+                            pitch_ceiling=PITCH_CEILING)
+    # One mask over the F0 track; Praat marks unvoiced frames as 0 Hz
+    f0 = pitch.selected_array['frequency']
+    f0 = f0[f0 > 0]
+    if f0.size:
+        feats['MDVP:Fo(Hz)']  = f0.mean()
+        feats['MDVP:Fhi(Hz)'] = f0.max()
+        feats['MDVP:Flo(Hz)'] = f0.min()
 
+    # One PointProcess, guided by the pitch track above, shared by every
+    # jitter/shimmer query so period extraction runs once per request
     try:
-        feats['MDVP:Jitter(%)']   = snd.to_jitter_local()*100
-        feats['MDVP:Jitter(Abs)'] = snd.to_jitter_local_absolute()
-        feats['MDVP:RAP']         = snd.to_jitter_rap()
-        feats['MDVP:PPQ']         = snd.to_jitter_ppq5()
-        feats['Jitter:DDP']       = snd.to_jitter_ddp()
-        feats['MDVP:Shimmer']     = snd.to_shimmer_local()
-        feats['MDVP:Shimmer(dB)'] = snd.to_shimmer_local_dB()
-        feats['Shimmer:APQ3']     = snd.to_shimmer_apq3()
-        feats['Shimmer:APQ5']     = snd.to_shimmer_apq5()
-        feats['MDVP:APQ']         = snd.to_shimmer_apq5()
-        feats['Shimmer:DDA']      = snd.to_shimmer_dda()
+        pp = call([snd, pitch], "To PointProcess (cc)")
     except Exception:
-        for m in [
-            'MDVP:Jitter(%)','MDVP:Jitter(Abs)','MDVP:RAP','MDVP:PPQ','Jitter:DDP',
-            'MDVP:Shimmer','MDVP:Shimmer(dB)','Shimmer:APQ3','Shimmer:APQ5',
-            'MDVP:APQ','Shimmer:DDA'
-        ]: feats[m] = np.nan
+        pp = None
+    if pp is not None:
+        for name, cmd, args, scale, needs_sound in _PRAAT_CALLS:
+            objs = [snd, pp] if needs_sound else pp
+            try:    feats[name] = scale * call(objs, cmd, *args)
+            except: feats[name] = np.nan
+        feats['MDVP:APQ'] = feats['Shimmer:APQ5']
 
     try:    feats['NHR'] = snd.to_noise_harmonics_ratio()
     except: feats['NHR'] = np.nan
     try:    feats['HNR'] = snd.to_harmonics_noise_ratio()
     except: feats['HNR'] = np.nan
 
-    for col in FEATURE_COLS:
-        feats.setdefault(col, np.nan)
+    # (1, 16) row in training column order, ready for the ONNX session
+    return np.array([[feats.get(c, np.nan) for c in FEATURE_COLS]], dtype=np.float32)
+
+def _pipeline(data: bytes, kind: str = "encoded") -> np.ndarray:
+    return extract_features(decode_audio(data, kind))
 
-    return pd.DataFrame([feats])[FEATURE_COLS]
+def run_pipeline(data: bytes, kind: str = "encoded") -> np.ndarray:
+    global _pool
+    pool = _get_pool()
+    try:
+        return pool.submit(_pipeline, data, kind).result()
+    except BrokenProcessPool:
+        # A crashed child poisons the whole pool; start a fresh one next time
+        with _pool_lock:
+            if _pool is pool:
+                _pool = None
+        raise
+
+def _warmup_features():
+    # Pool-child initializer: one dummy extraction so Praat's DSP tables are
+    # initialised before the child's first real job, not during it
+    try:
+        t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+        extract_features(parselmouth.Sound(values=0.3 * np.sin(2 * np.pi * 150 * t),
+                                           sampling_frequency=SAMPLE_RATE))
+    except Exception as e:
+        print("Warm-up failed:", e)
+
+@worker_init.connect
+def _warmup_worker(**_):
+    # Celery worker start: load the model and prime the ONNX kernels.  A
+    # worker that cannot load the model would fail every job, so refuse to
+    # start (WorkerShutdown, unlike other errors, escapes Celery's signal
+    # dispatch).
+    try:
+        get_session().run(None, {"x": np.zeros((1, len(FEATURE_COLS)), dtype=np.float32)})
+    except Exception as e:
+        raise WorkerShutdown(f"Could not load {MODEL_PATH}: {e}") from e
+    # Spawn every pool child now (each runs _warmup_features as it starts),
+    # so the first real jobs don't pay for interpreter start-up and Praat init
+    pool = _get_pool()
+    for f in [pool.submit(os.getpid) for _ in range(N_WORKERS)]:
+        f.result()
 
 @app.route("/", methods=["GET"])
 def health():
     return "Parkinson's Voice Classifier Backend Running!", 200
 
+def make_result(prob: float) -> dict:
+    print("Probability:", prob)
+    pred  = int(prob > THRESHOLD)
+    result_txt = "Likely Parkinson's Disease" if pred else "Likely Healthy"
+    print("Result:", result_txt)
+    return dict(result=result_txt,
+                probability=round(prob, 3),
+                threshold=THRESHOLD)
+
+@celery.task(name="run_inference")
+def run_inference(audio_b64: str, kind: str = "encoded", key: str | None = None) -> dict:
+    # key: blake3 of the upload as received, computed by the web tier
+    feats = run_pipeline(base64.b64decode(audio_b64), kind)
+    print("Extracted features:", dict(zip(FEATURE_COLS, feats[0].tolist())))
+    prob  = score(feats)
+    if key is not None:
+        cache_probability(key, prob)
+    return make_result(prob)
+
 @app.route("/predict", methods=["POST"])
 def predict():
-    orig_path = None
-    wav_path = None
     try:
-        if "file" not in request.files or request.files["file"].filename == "":
-            return jsonify(error="No file uploaded"), 400
-        upload = request.files["file"]
-
-        # Save upload as temp file
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_in:
-            upload.save(tmp_in.name)
-            orig_path = tmp_in.name
-
-        # Always convert to PCM WAV for Parselmouth
-        wav_path = f"/tmp/{uuid.uuid4()}.wav"
-        AudioSegment.from_file(orig_path).set_frame_rate(16000).set_channels(1).export(
-            wav_path, format="wav"
-        )
-
-        feats = extract_features(wav_path)
-        print("Extracted features:", feats)
-        prob  = float(rf_model.predict_proba(feats)[0, 1])
-        print("Probability:", prob)
-        pred  = int(prob > THRESHOLD)
-        result_txt = "Likely Parkinson's Disease" if pred else "Likely Healthy"
-        print("Result:", result_txt)
-        return jsonify(result=result_txt,
-                       probability=round(prob, 3),
-                       threshold=THRESHOLD)
+        if request.mimetype.startswith("audio/"):
+            if request.content_length == 0:
+                return jsonify(error="No file uploaded"), 400
+            # Raw WAV body: peek at the header so PCM16 mono skips ffmpeg
+            head = request.stream.read(44) if request.mimetype in WAV_MIMETYPES else b""
+            if _pcm16_mono_wav_rate(head):
+                data, kind = head + request.stream.read(), "wav"
+                if request.content_length is not None and len(data) < request.content_length:
+                    raise ClientDisconnected("Upload was interrupted before it finished")
+                key = blake3.blake3(data).hexdigest()
+            else:
+                # Anything else: decode (and hash) while it is still arriving
+                hasher = blake3.blake3()
+                data = stream_to_pcm(request.stream, head, request.content_length, hasher)
+                kind = "pcm"
+                key  = hasher.hexdigest()
+        else:
+            if "file" not in request.files or request.files["file"].filename == "":
+                return jsonify(error="No file uploaded"), 400
+            upload = request.files["file"]
+
+            # Already in memory (see InMemoryRequest); nothing touches /tmp
+            data = upload.read()
+
+            # Only sniff the header when the client claims to be sending WAV
+            is_wav = upload.mimetype in WAV_MIMETYPES and _pcm16_mono_wav_rate(data) > 0
+            kind = "wav" if is_wav else "encoded"
+            key  = blake3.blake3(data).hexdigest()
+
+        # Seen this exact upload before: answer now instead of queuing a job
+        prob = cached_probability(key)
+        if prob is not None:
+            return jsonify(make_result(prob)), 200
+
+        task = run_inference.delay(base64.b64encode(data).decode("ascii"), kind, key)
+        return jsonify(job_id=task.id), 202
+    except ClientDisconnected as e:
+        print("ERROR in prediction:", e.description)
+        return jsonify(error=e.description), 400
     except Exception as e:
         print("ERROR in prediction:", e)
         return jsonify(error=f"Prediction failed: {e}"), 500
-    finally:
-        _cleanup([orig_path, wav_path])
+
+@app.route("/predict/<job_id>", methods=["GET"])
+def predict_status(job_id):
+    task = run_inference.AsyncResult(job_id)
+    if not task.ready():
+        return jsonify(job_id=job_id, status=task.status), 202
+    if task.failed():
+        print("ERROR in prediction:", task.result)
+        return jsonify(error=f"Prediction failed: {task.result}"), 500
+    return jsonify(task.result)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=10000, debug=True)
@@ -0,0 +1,56 @@
+# ─────────────────────────────────────────────────────────────
+#  One-time export of rf_model.pkl → rf_model.onnx
+#  Run after re-training:  python convert_model.py
+#  Deps:  pip install -r requirements-convert.txt
+#  (the API itself only needs onnxruntime from requirements.txt)
+# ─────────────────────────────────────────────────────────────
+
+import joblib
+import numpy as np
+import onnxruntime as ort
+from onnx import helper
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+MODEL_PATH = "rf_model.pkl"
+ONNX_PATH  = "rf_model.onnx"
+
+rf_model = joblib.load(MODEL_PATH)
+n_feats  = rf_model.n_features_in_
+onnx_model = convert_sklearn(
+    rf_model,
+    initial_types=[("x", FloatTensorType([None, n_feats]))],
+    options={id(rf_model): {"zipmap": False}},
+    target_opset={"": 17, "ai.onnx.ml": 3},
+)
+
+# skl2onnx drops sklearn's NaN routing (missing_go_to_left); copy it across so
+# NaN features land in the same leaves as with predict_proba
+node = next(n for n in onnx_model.graph.node if n.op_type == "TreeEnsembleClassifier")
+attrs = {a.name: helper.get_attribute_value(a) for a in node.attribute}
+tracks_true = [
+    int(rf_model.estimators_[t].tree_.missing_go_to_left[n])
+    for t, n in zip(attrs["nodes_treeids"], attrs["nodes_nodeids"])
+]
+for i, a in enumerate(node.attribute):
+    if a.name == "nodes_missing_value_tracks_true":
+        del node.attribute[i]
+        break
+node.attribute.append(helper.make_attribute("nodes_missing_value_tracks_true", tracks_true))
+
+# Sanity check against sklearn over each feature's split range, with NaNs
+rng = np.random.default_rng(0)
+X = np.empty((2000, n_feats))
+for j in range(n_feats):
+    thr = np.concatenate([e.tree_.threshold[e.tree_.feature == j] for e in rf_model.estimators_])
+    # A feature the forest never splits on has no thresholds; any range will do
+    lo, hi = (thr.min(), thr.max()) if thr.size else (0.0, 1.0)
+    X[:, j] = rng.uniform(lo, hi, size=len(X))
+X[rng.random(X.shape) < 0.2] = np.nan
+sess = ort.InferenceSession(onnx_model.SerializeToString(), providers=["CPUExecutionProvider"])
+diff = np.abs(sess.run(None, {"x": X.astype(np.float32)})[1][:, 1] - rf_model.predict_proba(X)[:, 1]).max()
+assert diff < 1e-5, f"ONNX export disagrees with sklearn (max |Δp| = {diff})"
+
+with open(ONNX_PATH, "wb") as f:
+    f.write(onnx_model.SerializeToString())
+print(f"Wrote {ONNX_PATH} (max |Δp| vs sklearn = {diff:.2e})")
@@ -40,16 +40,42 @@ export default function App() {
   };
 
   // ── Send to backend ──────────────────────────────────────
+  // Error bodies from proxies / crashed workers may not be JSON
+  const readJson = async (r) => {
+    try {
+      return await r.json();
+    } catch {
+      return { error: `Server error (HTTP ${r.status})` };
+    }
+  };
+
+  // Unknown, expired or never-picked-up jobs stay "PENDING", so give up
+  // after MAX_POLLS seconds instead of spinning forever
+  const MAX_POLLS = 60;
+  const pollResult = async (jobId) => {
+    for (let i = 0; i < MAX_POLLS; i++) {
+      await new Promise((res) => setTimeout(res, 1000));
+      const r = await fetch(`${API_URL}/${jobId}`);
+      if (r.status !== 202) return readJson(r);
+    }
+    return { error: "Analysis timed out. Please try again." };
+  };
+
   const runAnalysis = async () => {
     if (!audioBlob) return setResult("⚠️  Please record first.");
 
     setResult("⏳ Analyzing…");
-    const fd = new FormData();
-    fd.append("file", audioBlob, "recording.webm");
 
     try {
-      const r = await fetch(API_URL, { method: "POST", body: fd });
-      const j = await r.json();
+      // Raw audio body (not multipart) so the backend decodes while uploading
+      const r = await fetch(API_URL, {
+        method: "POST",
+        headers: { "Content-Type": "audio/webm" },
+        body: audioBlob,
+      });
+      let j = await readJson(r);
+      // 202 → job queued; poll until the worker has a result
+      if (r.status === 202 && j.job_id) j = await pollResult(j.job_id);
       if (j.error) setResult("❌ " + j.error);
       else
         setResult(
@@ -0,0 +1,15 @@
+# ─────────────────────────────────────────────────────────────
+#  Gunicorn config – picked up automatically by `gunicorn app:app`
+# ─────────────────────────────────────────────────────────────
+
+import os
+
+bind         = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+
+# Import app.py once in the master; workers are forked from it and share
+# those pages copy-on-write.  (The model itself lives in the Celery worker.)
+preload_app  = True
+workers      = int(os.environ.get("WEB_CONCURRENCY", 2))
+worker_class = "gthread"
+threads      = int(os.environ.get("GUNICORN_THREADS", 4))
+timeout      = 120